@@ -19,10 +19,13 @@ except ImportError:
 from .calibrate import TensorData
 from .onnx_model import ONNXModel
 from .quant_utils import (
+    ONNX_INT_TYPE_RANGE,
     ONNX_TYPE_TO_NP_TYPE,
     TENSOR_NAME_QUANT_SUFFIX,
     QuantType,
+    compute_scale_zp_vec,
     find_by_name,
+    get_qmin_qmax_for_qType,
     model_has_infer_metadata,
     normalize_axis,
     pack_bytes_to_4bit,
@@ -417,58 +420,85 @@ class BaseQuantizer:
             ),
         )
         reduce_range = quant_overrides_for_channels[0].get("reduce_range", self.reduce_range and reduce_range)
-        zero_point_list = []
-        scale_list = []
-        quantized_per_channel_data_list = []
         weights_shape = list(weights.shape)
-        reshape_dims = list(weights_shape)  # deep copy
-        reshape_dims[channel_axis] = 1  # only one per channel for reshape
-        for i in range(channel_count):
-            per_channel_data = weights.take(i, channel_axis)
-            channel_override_index = i if i < num_channel_overrides else 0
-            channel_quant_overrides = quant_overrides_for_channels[channel_override_index]
-
-            if "scale" in channel_quant_overrides and "zero_point" in channel_quant_overrides:
-                zero_point = np.array(channel_quant_overrides["zero_point"], dtype=ONNX_TYPE_TO_NP_TYPE[weight_qType])
-                scale = np.array(channel_quant_overrides["scale"])
-                quantized_per_channel_data = quantize_nparray(
-                    weight_qType, per_channel_data.flatten(), scale, zero_point
-                )
-                assert isinstance(zero_point, np.ndarray), f"Unexpected type {type(zero_point)}"
-                assert (
-                    zero_point.dtype != np.float32 and zero_point.dtype != np.float16
-                ), f"Unexpected dtype {zero_point.dtype}"
-                assert isinstance(scale, np.ndarray), f"Unexpected type {type(scale)}"
-                assert isinstance(
-                    quantized_per_channel_data, np.ndarray
-                ), f"Unexpected type {type(quantized_per_channel_data)}"
-
-            else:
-                _, _, zero_point, scale, quantized_per_channel_data = quantize_data(
-                    per_channel_data.flatten(),
-                    weight_qType,
-                    symmetric,
-                    reduce_range=reduce_range,
-                    min_real_range=self.min_real_range,
-                    rmin_override=channel_quant_overrides.get("rmin"),
-                    rmax_override=channel_quant_overrides.get("rmax"),
-                )
+        if (
+            weight_qType in ONNX_INT_TYPE_RANGE
+            and weights.size > 0
+            and self.min_real_range is None
+            and not any(
+                key in channel_quant_overrides
+                for channel_quant_overrides in quant_overrides_for_channels
+                for key in ("scale", "zero_point", "rmin", "rmax")
+            )
+        ):
+            # Every channel shares qmin, qmax, symmetric and reduce_range, so compute all the
+            # scales and zero points at once and quantize the whole tensor in a single call.
+            reduce_axes = tuple(axis for axis in range(weights_rank) if axis != channel_axis)
+            qmin, qmax = get_qmin_qmax_for_qType(weight_qType, reduce_range, symmetric=symmetric)
+            zero_points, scales = compute_scale_zp_vec(
+                weights.min(axis=reduce_axes), weights.max(axis=reduce_axes), qmin, qmax, symmetric
+            )
+            channel_shape = [1] * weights_rank
+            channel_shape[channel_axis] = channel_count
+            quantized_weights = quantize_nparray(
+                weight_qType, weights, scales.reshape(channel_shape), zero_points.reshape(channel_shape)
+            )
+            zero_point_list = [zero_points]
+            scale_list = [scales]
+        else:
+            zero_point_list = []
+            scale_list = []
+            quantized_per_channel_data_list = []
+            reshape_dims = list(weights_shape)  # deep copy
+            reshape_dims[channel_axis] = 1  # only one per channel for reshape
+            for i in range(channel_count):
+                per_channel_data = weights.take(i, channel_axis)
+                channel_override_index = i if i < num_channel_overrides else 0
+                channel_quant_overrides = quant_overrides_for_channels[channel_override_index]
+
+                if "scale" in channel_quant_overrides and "zero_point" in channel_quant_overrides:
+                    zero_point = np.array(
+                        channel_quant_overrides["zero_point"], dtype=ONNX_TYPE_TO_NP_TYPE[weight_qType]
+                    )
+                    scale = np.array(channel_quant_overrides["scale"])
+                    quantized_per_channel_data = quantize_nparray(
+                        weight_qType, per_channel_data.flatten(), scale, zero_point
+                    )
+                    assert isinstance(zero_point, np.ndarray), f"Unexpected type {type(zero_point)}"
+                    assert (
+                        zero_point.dtype != np.float32 and zero_point.dtype != np.float16
+                    ), f"Unexpected dtype {zero_point.dtype}"
+                    assert isinstance(scale, np.ndarray), f"Unexpected type {type(scale)}"
+                    assert isinstance(
+                        quantized_per_channel_data, np.ndarray
+                    ), f"Unexpected type {type(quantized_per_channel_data)}"
+
+                else:
+                    _, _, zero_point, scale, quantized_per_channel_data = quantize_data(
+                        per_channel_data.flatten(),
+                        weight_qType,
+                        symmetric,
+                        reduce_range=reduce_range,
+                        min_real_range=self.min_real_range,
+                        rmin_override=channel_quant_overrides.get("rmin"),
+                        rmax_override=channel_quant_overrides.get("rmax"),
+                    )
 
-                assert isinstance(zero_point, np.ndarray), f"Unexpected type {type(zero_point)}"
-                assert (
-                    zero_point.dtype != np.float32 and zero_point.dtype != np.float16
-                ), f"Unexpected dtype {zero_point.dtype}"
-                assert isinstance(scale, np.ndarray), f"Unexpected type {type(scale)}"
-                assert isinstance(
-                    quantized_per_channel_data, np.ndarray
-                ), f"Unexpected type {type(quantized_per_channel_data)}"
-
-            zero_point_list.append(zero_point)
-            scale_list.append(scale)
-            quantized_per_channel_data_list.append(np.asarray(quantized_per_channel_data).reshape(reshape_dims))
-
-        # combine per_channel_data into one
-        quantized_weights = np.concatenate(quantized_per_channel_data_list, channel_axis)
+                    assert isinstance(zero_point, np.ndarray), f"Unexpected type {type(zero_point)}"
+                    assert (
+                        zero_point.dtype != np.float32 and zero_point.dtype != np.float16
+                    ), f"Unexpected dtype {zero_point.dtype}"
+                    assert isinstance(scale, np.ndarray), f"Unexpected type {type(scale)}"
+                    assert isinstance(
+                        quantized_per_channel_data, np.ndarray
+                    ), f"Unexpected type {type(quantized_per_channel_data)}"
+
+                zero_point_list.append(zero_point)
+                scale_list.append(scale)
+                quantized_per_channel_data_list.append(quantized_per_channel_data.reshape(reshape_dims))
+
+            # combine per_channel_data into one
+            quantized_weights = np.concatenate(quantized_per_channel_data_list, channel_axis)
         q_weight_name = weight_name + TENSOR_NAME_QUANT_SUFFIX
         zp_name = weight_name + "_zero_point"
         scale_name = weight_name + "_scale"
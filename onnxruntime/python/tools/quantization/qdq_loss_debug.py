@@ -53,7 +53,7 @@ from .quant_utils import (
     DEQUANT_OUTPUT_SUFFIX,
     QUANT_INPUT_SUFFIX,
     TENSOR_NAME_QUANT_SUFFIX,
-    find_by_name,
+    build_name_index,
     load_model_with_shape_infer,
 )
 
@@ -289,12 +289,13 @@ def create_weight_matching(float_model_path: str, qdq_model_path: str) -> Dict[s
     qdq_onnx_model = ONNXModel(load_model_with_shape_infer(Path(qdq_model_path)))
 
     matched_weights: Dict[str, Dict[str, numpy.ndarray]] = {}
-    initializers = qdq_onnx_model.initializer()
+    initializers = build_name_index(qdq_onnx_model.initializer())
+    float_initializers = build_name_index(float_onnx_model.initializer())
     for node in qdq_onnx_model.nodes():
         if node.op_type != DEQUANT_OP_NAME:
             continue  # Only care about DQ node
         weight_name: str = node.input[0]
-        weight_values = find_by_name(weight_name, initializers)
+        weight_values = initializers.get(weight_name)
         if not weight_values:
             continue  # Only care about DQ node with const inputs
         if not weight_name.endswith(TENSOR_NAME_QUANT_SUFFIX):
@@ -307,9 +308,9 @@ def create_weight_matching(float_model_path: str, qdq_model_path: str) -> Dict[s
                 axis = attr.i
 
         weight_tensor = numpy_helper.to_array(weight_values)
-        weight_scale = numpy_helper.to_array(find_by_name(node.input[1], initializers))
+        weight_scale = numpy_helper.to_array(initializers.get(node.input[1]))
         if len(node.input) > 2:
-            weight_zp = numpy_helper.to_array(find_by_name(node.input[2], initializers))
+            weight_zp = numpy_helper.to_array(initializers.get(node.input[2]))
         else:
             weight_zp = numpy.zeros(weight_scale.shape, dtype=numpy.int32)
 
@@ -328,7 +329,7 @@ def create_weight_matching(float_model_path: str, qdq_model_path: str) -> Dict[s
             logging.error(f"Model Error in '{qdq_model_path}': '{weight_name}' per-channel quantization on 0 channel")
             continue
 
-        float_values = find_by_name(weight_name, float_onnx_model.initializer())
+        float_values = float_initializers.get(weight_name)
         if not float_values:
             logging.error(f"Model Error in '{float_model_path}': weight tensor '{weight_name}' not found!")
             continue
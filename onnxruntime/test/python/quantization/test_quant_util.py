@@ -5,20 +5,28 @@
 # license information.
 # --------------------------------------------------------------------------
 
+import os
 import tempfile
 import unittest
+from importlib.util import find_spec
 from pathlib import Path
+from unittest import mock
 
 import numpy
 import onnx
 from onnx import TensorProto, helper, numpy_helper
+from onnx.reference import ReferenceEvaluator
 
+from onnxruntime.quantization import quant_utils
 from onnxruntime.quantization.quant_utils import (
     compute_scale_zp,
+    compute_scale_zp_vec,
+    get_qmin_qmax_for_qType,
     load_model_with_shape_infer,
     model_has_infer_metadata,
     pack_bytes_to_4bit,
     quantize_data,
+    quantize_nparray,
 )
 
 
@@ -80,6 +88,27 @@ class TestQuantUtil(unittest.TestCase):
             [0, 0.0002 / 65535],
         )
 
+    def test_compute_scale_zp_vec(self):
+        """
+        Test that compute_scale_zp_vec gives the same zero points and scales as compute_scale_zp on each channel.
+        """
+        rmins = numpy.array([0.0, -1.0, -0.5, 0.0, 1e-30, -3.25, 2.0], dtype=numpy.float32)
+        rmaxs = numpy.array([0.0, 1.0, 2.5, 4.0, 2e-30, -1.0, 7.5], dtype=numpy.float32)
+
+        for onnx_type in (TensorProto.INT8, TensorProto.UINT8, TensorProto.INT16, TensorProto.UINT16):
+            for symmetric in (False, True):
+                with self.subTest(onnx_type=onnx_type, symmetric=symmetric):
+                    qmin, qmax = get_qmin_qmax_for_qType(onnx_type, symmetric=symmetric)
+                    zero_points, scales = compute_scale_zp_vec(rmins, rmaxs, qmin, qmax, symmetric)
+                    self.assertEqual(zero_points.shape, rmins.shape)
+                    self.assertEqual(scales.shape, rmins.shape)
+                    for i in range(rmins.size):
+                        zero_point, scale = compute_scale_zp(rmins[i], rmaxs[i], qmin, qmax, symmetric)
+                        self.assertEqual(zero_points.dtype, zero_point.dtype)
+                        self.assertEqual(scales.dtype, scale.dtype)
+                        self.assertEqual(zero_points[i], zero_point)
+                        self.assertEqual(scales[i], scale)
+
     def test_load_external_model(self):
         input_name = "input"
         output_name = "output"
@@ -172,6 +201,104 @@ class TestQuantUtil(unittest.TestCase):
 
                     self.assertEqual(numpy.array(actual_quant_val), expected_quant_val)
 
+    def test_quantize_nparray_scale_dtype(self):
+        """
+        Test that integer quantize_nparray divides in the dtype the scale promotes to and rounds only once.
+        """
+        data_float = numpy.random.default_rng(3).normal(scale=100.0, size=60000).astype(numpy.float32)
+        zero_point = numpy.array(0, dtype=numpy.int16)
+
+        for scale in (numpy.array(0.0123456789), numpy.array(0.0123456789, dtype=numpy.float32), 0.0123456789):
+            with self.subTest(scale_type=type(scale), scale_dtype=getattr(scale, "dtype", None)):
+                expected = numpy.asarray((data_float.astype(numpy.float32) / scale).round() + zero_point)
+                numpy.clip(expected, -32767, 32767, out=expected)
+                actual = quantize_nparray(TensorProto.INT16, data_float, scale, zero_point)
+                self.assertEqual(actual.dtype, numpy.int16)
+                numpy.testing.assert_array_equal(actual, expected.astype(numpy.int16))
+
+    def test_quantize_nparray_float8e4m3fn(self):
+        """
+        Test that quantize_nparray matches the reference QuantizeLinear for float 8, including ties,
+        saturation, signed zeros, and NaN.
+        """
+        f8_values = numpy_helper.float8e4m3_to_float32(numpy.arange(256, dtype=numpy.uint8)).astype(numpy.float32)
+        f8_finite = numpy.sort(f8_values[numpy.isfinite(f8_values)])
+        f8_midpoints = (f8_finite[1:] + f8_finite[:-1]) * 0.5
+        special = numpy.array([0.0, -0.0, numpy.inf, -numpy.inf, numpy.nan, 500.0, -500.0, 1e-10], dtype=numpy.float32)
+        random = numpy.random.default_rng(1).normal(scale=100.0, size=1000).astype(numpy.float32)
+        data_float = numpy.concatenate([f8_finite, f8_midpoints, numpy.nextafter(f8_midpoints, 0), special, random])
+
+        for dtype in (numpy.float32, numpy.float16):
+            with self.subTest(dtype=dtype):
+                data = data_float.astype(dtype)
+                scale = numpy.array(0.75, dtype=dtype)
+                onnx_type = helper.np_dtype_to_tensor_dtype(numpy.dtype(dtype))
+                ref = ReferenceEvaluator(
+                    helper.make_model(
+                        helper.make_graph(
+                            [
+                                helper.make_node(
+                                    "Constant",
+                                    [],
+                                    ["zero_point"],
+                                    value=helper.make_tensor("zero_point", TensorProto.FLOAT8E4M3FN, [], [0]),
+                                ),
+                                helper.make_node("QuantizeLinear", ["X", "scale", "zero_point"], ["Y"]),
+                            ],
+                            "qu",
+                            [
+                                helper.make_tensor_value_info("X", onnx_type, None),
+                                helper.make_tensor_value_info("scale", onnx_type, None),
+                            ],
+                            [helper.make_tensor_value_info("Y", TensorProto.FLOAT8E4M3FN, None)],
+                        )
+                    )
+                )
+                expected = ref.run(None, {"X": data, "scale": scale})[0]
+                actual = quantize_nparray(TensorProto.FLOAT8E4M3FN, data, scale, 0)
+                self.assertEqual(actual.dtype, expected.dtype)
+                numpy.testing.assert_array_equal(actual.view(numpy.uint8), expected.view(numpy.uint8))
+
+    @unittest.skipUnless(find_spec("numba"), "numba is not installed")
+    def test_quantize_nparray_numba_kernel(self):
+        """
+        Test that the numba kernel gives the same integer quantization as the NumPy path.
+        A float64 scale must give the same result as well, even though the kernel only divides in float32.
+        """
+        for scale in (numpy.array(0.25, dtype=numpy.float32), numpy.array(0.0123456789)):
+            data_float = numpy.random.default_rng(2).normal(scale=50.0, size=(64, 129)).astype(numpy.float32)
+            data_float[0, :80] = (numpy.arange(-40, 40) + 0.5) * scale  # ties to even
+            data_float[1:5] = ((numpy.arange(-258, 258) + 0.5) * scale).reshape(4, 129)  # close to ties
+            data_float = data_float[:, ::2]  # non-contiguous input
+
+            for onnx_type in (TensorProto.INT8, TensorProto.UINT8, TensorProto.INT16, TensorProto.UINT16):
+                with self.subTest(onnx_type=onnx_type, scale_dtype=scale.dtype):
+                    np_type = helper.tensor_dtype_to_np_dtype(onnx_type)
+                    zero_point = numpy.array(3, dtype=np_type)
+                    with mock.patch.object(quant_utils, "_NUMBA_MIN_SIZE", data_float.size + 1):
+                        expected = quantize_nparray(onnx_type, data_float, scale, zero_point, high=100)
+                    with mock.patch.object(quant_utils, "_NUMBA_MIN_SIZE", 1), mock.patch.dict(
+                        os.environ, {"QUANTIZATION_USE_NUMBA": "1"}
+                    ):
+                        actual = quantize_nparray(onnx_type, data_float, scale, zero_point, high=100)
+                    self.assertEqual(actual.dtype, expected.dtype)
+                    numpy.testing.assert_array_equal(actual, expected)
+
+    def test_quantize_nparray_numba_is_opt_in(self):
+        """
+        Test that quantize_nparray does not build the numba kernel unless QUANTIZATION_USE_NUMBA is set.
+        """
+        data_float = numpy.arange(-50, 50, dtype=numpy.float32)
+        scale = numpy.array(0.5, dtype=numpy.float32)
+        zero_point = numpy.array(0, dtype=numpy.int8)
+        with mock.patch.object(quant_utils, "_NUMBA_MIN_SIZE", 1), mock.patch.object(
+            quant_utils, "_get_quantize_int_kernel"
+        ) as get_kernel, mock.patch.dict(os.environ):
+            os.environ.pop("QUANTIZATION_USE_NUMBA", None)
+            quantized = quantize_nparray(TensorProto.INT8, data_float, scale, zero_point)
+        get_kernel.assert_not_called()
+        numpy.testing.assert_array_equal(quantized, numpy.clip(numpy.round(data_float / scale), -127, 127))
+
 
 if __name__ == "__main__":
     unittest.main()
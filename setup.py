@@ -776,6 +776,8 @@ setup(
     download_url="https://github.com/microsoft/onnxruntime/tags",
     data_files=data_files,
     install_requires=install_requires,
+    # Optional fused kernel for quantizing very large tensors, enabled with QUANTIZATION_USE_NUMBA=1.
+    extras_require={"numba": ["numba"]},
     keywords="onnx machine learning",
     entry_points={
         "console_scripts": [